@@ -0,0 +1,34 @@
+# Call Policy Configuration shared by all Bedrock call stages
+
+# Hedging defaults; each stage only sets its own deadline
+CALL_POLICY_DEFAULTS = {
+    "hedge_percentile": 95,  # duplicate calls slower than p95 (None disables hedging)
+    "hedge_budget": 0.05,  # at most 5% of calls may be hedged
+    "min_samples": 20  # latency samples needed before hedging starts
+}
+
+# Upper bound on connection setup, taken out of each attempt's share of the deadline
+CONNECT_TIMEOUT_S = 5
+
+# botocore attempts per call, including the first; throttled calls back off and retry
+RETRY_ATTEMPTS = 3
+
+def call_policy_config(deadline_s: float, **overrides) -> dict:
+    """Return CallPolicy settings for a stage with the given hard deadline in seconds."""
+    return {**CALL_POLICY_DEFAULTS, "deadline_s": deadline_s, **overrides}
+
+def bedrock_client_config(deadline_s: float) -> 'Config':
+    """
+    Return a botocore Config whose retry attempts together fit inside the stage deadline,
+    so throttling is retried while a call abandoned by CallPolicy still releases its thread
+    soon after the deadline.
+    """
+    from botocore.config import Config
+
+    attempt_s = deadline_s / RETRY_ATTEMPTS
+    connect_timeout = min(CONNECT_TIMEOUT_S, attempt_s / 4)
+    return Config(
+        connect_timeout=connect_timeout,
+        read_timeout=attempt_s - connect_timeout,
+        retries={"total_max_attempts": RETRY_ATTEMPTS, "mode": "adaptive"}  # client-side rate limiting on throttles
+    )
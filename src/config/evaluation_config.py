@@ -1,6 +1,7 @@
 # Evaluation System Configuration
 import os
 from dotenv import load_dotenv
+from .call_policy_config import call_policy_config, bedrock_client_config
 
 # Load environment variables
 load_dotenv()
@@ -34,6 +35,16 @@ GEVAL_CONFIG = {
     "verbose_mode": False  # debug output
 }
 
+# Pipeline Configuration
+PIPELINE_CONFIG = {
+    "generation_workers": 4,  # concurrent RAG retrieve/generate calls
+    "judge_workers": 4,  # concurrent G-Eval judge calls
+    "queue_depth": 8  # max cases buffered between stages (backpressure)
+}
+
+# Per-call deadline for judge calls (hedging defaults in call_policy_config.py)
+JUDGE_CALL_POLICY_CONFIG = call_policy_config(deadline_s=120)
+
 # Evaluation Criteria
 EVALUATION_CRITERIA = """
 Evaluate the response for:
@@ -50,5 +61,6 @@ def create_evaluator_model() -> 'ChatBedrock':
     return ChatBedrock(
         model_id=EVALUATOR_MODEL_CONFIG["model_id"],
         region_name=EVALUATOR_MODEL_CONFIG["region_name"],
-        model_kwargs=EVALUATOR_MODEL_CONFIG["model_kwargs"]
+        model_kwargs=EVALUATOR_MODEL_CONFIG["model_kwargs"],
+        config=bedrock_client_config(JUDGE_CALL_POLICY_CONFIG["deadline_s"])
     )
\ No newline at end of file
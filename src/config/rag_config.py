@@ -2,6 +2,7 @@
 import os
 from dotenv import load_dotenv
 from langchain_aws import ChatBedrock
+from .call_policy_config import call_policy_config, bedrock_client_config
 
 # Load environment variables
 load_dotenv()
@@ -27,6 +28,15 @@ KNOWLEDGE_BASE_CONFIG = {
     "num_results": 3
 }
 
+# Per-call deadlines for RAG calls (hedging defaults in call_policy_config.py)
+CALL_POLICY_CONFIG = {
+    "retrieve": call_policy_config(deadline_s=15),  # knowledge base retrieval
+    "generate": call_policy_config(deadline_s=90)  # RAG model answer
+}
+
 def create_bedrock_model() -> ChatBedrock:
     """Create and return a configured AWS Bedrock model instance."""
-    return ChatBedrock(**BEDROCK_CONFIG)
\ No newline at end of file
+    return ChatBedrock(
+        **BEDROCK_CONFIG,
+        config=bedrock_client_config(CALL_POLICY_CONFIG["generate"]["deadline_s"])
+    )
\ No newline at end of file
@@ -1,16 +1,68 @@
 from typing import List
-from deepeval import evaluate
 from deepeval.test_case import LLMTestCase
 from deepeval.metrics import GEval
 from deepeval.test_case import LLMTestCaseParams
 from ..config.evaluation_config import GEVAL_CONFIG, EVALUATION_CRITERIA
 from ..models.aws_bedrock import AWSBedrock
+from ..models.call_policy import CallTimeoutError
+from ..reporting.telemetry import RunTelemetry, case_query
 from langchain_aws import ChatBedrock
+from typing import Optional
+
+class MetricResult:
+    def __init__(
+        self,
+        name: str,
+        score: float,
+        threshold: float,
+        success: bool,
+        reason: Optional[str],
+        evaluation_model: Optional[str]
+    ):
+        self.name = name
+        self.score = score
+        self.threshold = threshold
+        self.success = success
+        self.reason = reason
+        self.evaluation_model = evaluation_model
+
+class CaseResult:
+    """Result of judging a single test case, shaped like a deepeval TestResult"""
+    def __init__(
+        self,
+        input: str,
+        expected_output: str,
+        actual_output: Optional[str],
+        metrics_data: List[MetricResult],
+        status: str = "ok",
+        error: Optional[str] = None
+    ):
+        self.input = input
+        self.expected_output = expected_output
+        self.actual_output = actual_output
+        self.metrics_data = metrics_data
+        self.status = status
+        self.error = error
+
+    @classmethod
+    def failed(cls, input: str, expected_output: str, error: Exception,
+               actual_output: Optional[str] = None) -> 'CaseResult':
+        """
+        Result for a case that could not be generated or judged; it carries no score
+        """
+        return cls(
+            input=input,
+            expected_output=expected_output,
+            actual_output=actual_output,
+            metrics_data=[],
+            status="timeout" if isinstance(error, CallTimeoutError) else "error",
+            error=str(error)
+        )
 
 class Evaluator:
-    def __init__(self, model: ChatBedrock):
+    def __init__(self, model: ChatBedrock, telemetry: Optional[RunTelemetry] = None):
         # Wrap the ChatBedrock model in our custom AWSBedrock class
-        self.model = AWSBedrock(model=model)
+        self.model = AWSBedrock(model=model, telemetry=telemetry)
         
     def create_geval_metric(self) -> GEval:
         """
@@ -35,16 +87,41 @@ class Evaluator:
             verbose_mode=GEVAL_CONFIG["verbose_mode"]
         )
         
-    def evaluate_test_cases(self, test_cases: List[LLMTestCase]) -> dict:
+    def evaluate_test_case(self, test_case: LLMTestCase) -> CaseResult:
         """
-        Evaluate test cases using G-Eval
+        Evaluate a single test case using G-Eval
         
         Args:
-            test_cases: List of test cases to evaluate
+            test_case: Test case to evaluate
             
         Returns:
-            dict: Evaluation results
+            CaseResult: Evaluation result for the test case
         """
-        metric = self.create_geval_metric()
-        results = evaluate(test_cases=test_cases, metrics=[metric])
-        return results
\ No newline at end of file
+        # GEval keeps its score on the instance, so each case gets its own metric
+        # Tag judge calls with the golden so their timings can be tied back to it
+        token = case_query.set(test_case.input)
+        try:
+            metric = self.create_geval_metric()
+            metric.measure(test_case, _show_indicator=False)
+        except Exception as e:
+            print(f"Error in evaluation: {str(e)}")
+            return CaseResult.failed(
+                test_case.input, test_case.expected_output, e, test_case.actual_output
+            )
+        finally:
+            case_query.reset(token)
+            
+        metric_result = MetricResult(
+            name=metric.__name__,
+            score=metric.score,
+            threshold=metric.threshold,
+            success=metric.is_successful(),
+            reason=metric.reason,
+            evaluation_model=metric.evaluation_model
+        )
+        return CaseResult(
+            input=test_case.input,
+            expected_output=test_case.expected_output,
+            actual_output=test_case.actual_output,
+            metrics_data=[metric_result]
+        )
\ No newline at end of file
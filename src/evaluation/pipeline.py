@@ -0,0 +1,223 @@
+from typing import Callable, List, Optional
+import queue
+import threading
+import time
+from .test_case_generator import TestCaseGenerator
+from .evaluator import Evaluator, CaseResult
+from ..config.evaluation_config import PIPELINE_CONFIG
+
+# Marks the end of a stage's output on a queue
+_DONE = object()
+
+# How often a blocked queue operation re-checks whether the run was stopped
+_POLL_INTERVAL_S = 0.5
+
+# How long run() waits for worker threads once the result stream has ended
+_JOIN_TIMEOUT_S = 5.0
+
+def _put(target: queue.Queue, item, stop: threading.Event) -> bool:
+    """
+    Put with backpressure, giving up once the run is stopped
+    """
+    while not stop.is_set():
+        try:
+            target.put(item, timeout=_POLL_INTERVAL_S)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+def _get(source: queue.Queue, stop: threading.Event):
+    """
+    Blocking get that returns _DONE once the run is stopped
+    """
+    while not stop.is_set():
+        try:
+            return source.get(timeout=_POLL_INTERVAL_S)
+        except queue.Empty:
+            continue
+    return _DONE
+
+class _StageExit:
+    def __init__(self, workers: int, downstream: queue.Queue, consumers: int,
+                 stop: threading.Event):
+        """
+        Close a downstream queue once every worker of a stage has finished
+
+        Args:
+            workers: Number of workers in the stage
+            downstream: Queue the stage writes to
+            consumers: Number of readers of the downstream queue
+            stop: Set when the run is abandoned
+        """
+        self.remaining = workers
+        self.downstream = downstream
+        self.consumers = consumers
+        self.stop = stop
+        self._lock = threading.Lock()
+
+    def worker_done(self):
+        with self._lock:
+            self.remaining -= 1
+            last = self.remaining == 0
+        if last:
+            for _ in range(self.consumers):
+                _put(self.downstream, _DONE, self.stop)
+
+class EvaluationPipeline:
+    def __init__(
+        self,
+        test_generator: TestCaseGenerator,
+        evaluator: Evaluator,
+        generation_workers: int = PIPELINE_CONFIG["generation_workers"],
+        judge_workers: int = PIPELINE_CONFIG["judge_workers"],
+        queue_depth: int = PIPELINE_CONFIG["queue_depth"]
+    ):
+        """
+        Streaming retrieve -> generate -> judge pipeline
+
+        Each golden flows through the stages on its own, so the RAG model and
+        the evaluator model are busy at the same time. Stages are connected by
+        bounded queues: a slow stage blocks its upstream instead of letting
+        test cases pile up in memory.
+
+        Args:
+            test_generator: Produces test cases from goldens via the RAG handler
+            evaluator: Judges test cases with G-Eval
+            generation_workers: Concurrent RAG calls
+            judge_workers: Concurrent judge calls
+            queue_depth: Maximum items buffered between two stages
+        """
+        self.test_generator = test_generator
+        self.evaluator = evaluator
+        self.generation_workers = generation_workers
+        self.judge_workers = judge_workers
+        self.queue_depth = queue_depth
+
+    def run(self, on_result: Callable[[int, CaseResult], None]) -> int:
+        """
+        Run every golden through the pipeline
+
+        Cases that fail to generate or judge are reported as failed results
+        rather than dropped. If a worker thread or on_result fails, the run is
+        stopped and the error re-raised here.
+
+        Args:
+            on_result: Called on the calling thread with (test_id, result) as
+                each case finishes; results arrive in completion order
+
+        Returns:
+            int: Number of cases reported
+        """
+        # Load up front so a missing or malformed golden file fails the run directly
+        golden_cases = self.test_generator.data_loader.load_golden_testcases()
+
+        stop = threading.Event()
+        failures: List[BaseException] = []
+        golden_queue = queue.Queue(maxsize=self.queue_depth)
+        case_queue = queue.Queue(maxsize=self.queue_depth)
+        result_queue = queue.Queue(maxsize=self.queue_depth)
+
+        generation_exit = _StageExit(self.generation_workers, case_queue, self.judge_workers, stop)
+        judge_exit = _StageExit(self.judge_workers, result_queue, 1, stop)
+
+        threads = [
+            threading.Thread(
+                target=self._run_worker,
+                args=(self._feed, (golden_cases, golden_queue, stop), None, stop, failures),
+                daemon=True
+            )
+        ]
+        threads += [
+            threading.Thread(
+                target=self._run_worker,
+                args=(self._generate, (golden_queue, case_queue, result_queue, stop),
+                      generation_exit, stop, failures),
+                daemon=True
+            )
+            for _ in range(self.generation_workers)
+        ]
+        threads += [
+            threading.Thread(
+                target=self._run_worker,
+                args=(self._judge, (case_queue, result_queue, stop), judge_exit, stop, failures),
+                daemon=True
+            )
+            for _ in range(self.judge_workers)
+        ]
+        for thread in threads:
+            thread.start()
+
+        completed = 0
+        try:
+            while True:
+                item = _get(result_queue, stop)
+                if item is _DONE:
+                    break
+                test_id, result = item
+                on_result(test_id, result)
+                completed += 1
+        finally:
+            # Release any worker still blocked on a queue, then abandon stragglers
+            stop.set()
+            join_deadline = time.monotonic() + _JOIN_TIMEOUT_S
+            for thread in threads:
+                thread.join(timeout=max(0.0, join_deadline - time.monotonic()))
+
+        if failures:
+            raise failures[0]
+        return completed
+
+    def _run_worker(self, target: Callable, args: tuple, stage_exit: Optional[_StageExit],
+                    stop: threading.Event, failures: List[BaseException]):
+        try:
+            target(*args)
+        except Exception as e:
+            print(f"Error in evaluation pipeline: {str(e)}")
+            failures.append(e)
+            stop.set()
+        finally:
+            if stage_exit is not None:
+                stage_exit.worker_done()
+
+    def _feed(self, golden_cases: list, golden_queue: queue.Queue, stop: threading.Event):
+        for test_id, golden in enumerate(golden_cases, 1):
+            if not _put(golden_queue, (test_id, golden), stop):
+                return
+        for _ in range(self.generation_workers):
+            _put(golden_queue, _DONE, stop)
+
+    def _generate(self, golden_queue: queue.Queue, case_queue: queue.Queue,
+                  result_queue: queue.Queue, stop: threading.Event):
+        while True:
+            item = _get(golden_queue, stop)
+            if item is _DONE:
+                return
+            test_id, golden = item
+            try:
+                test_case = self.test_generator.create_test_case(golden)
+            except Exception as e:
+                print(f"Error generating test case {test_id}: {str(e)}")
+                # Nothing to judge, so the failed case goes straight to the results
+                failed = CaseResult.failed(golden.input, golden.expected_output, e)
+                if not _put(result_queue, (test_id, failed), stop):
+                    return
+                continue
+            if not _put(case_queue, (test_id, test_case), stop):
+                return
+
+    def _judge(self, case_queue: queue.Queue, result_queue: queue.Queue, stop: threading.Event):
+        while True:
+            item = _get(case_queue, stop)
+            if item is _DONE:
+                return
+            test_id, test_case = item
+            try:
+                result = self.evaluator.evaluate_test_case(test_case)
+            except Exception as e:
+                print(f"Error evaluating test case {test_id}: {str(e)}")
+                result = CaseResult.failed(
+                    test_case.input, test_case.expected_output, e, test_case.actual_output
+                )
+            if not _put(result_queue, (test_id, result), stop):
+                return
@@ -1,5 +1,4 @@
-from typing import List
-from ..data.data_loader import DataLoader
+from ..data.data_loader import DataLoader, GoldenTestCase
 from ..rag.rag_handler import RAGHandler
 from deepeval.test_case import LLMTestCase
 import json
@@ -9,34 +8,29 @@ class TestCaseGenerator:
         self.rag_handler = rag_handler
         self.data_loader = data_loader
         
-    def generate_test_cases(self) -> List[LLMTestCase]:
+    def create_test_case(self, golden: GoldenTestCase) -> LLMTestCase:
         """
-        Generate test cases from golden examples:
-        1. Load golden test cases using DataLoader
-        2. For each golden:
-           - Get RAG response for input
-           - Create LLMTestCase using golden data and RAG response
+        Get the RAG response for a single golden and wrap it in an LLMTestCase
         
+        Args:
+            golden: Golden test case
+            
         Returns:
-            List[LLMTestCase]: List of test cases ready for G-Eval
+            LLMTestCase: Test case ready for G-Eval
+            
+        Raises:
+            CallTimeoutError: If a RAG call misses its deadline
+            RAGError: If retrieval or generation fails
         """
-        # Load golden test cases using DataLoader
-        golden_cases = self.data_loader.load_golden_testcases()
-        test_cases = []
+        # Get RAG response for input
+        rag_response = self.rag_handler.get_rag_response(
+            query=golden.input
+        )
         
-        for item in golden_cases:
-            # Get RAG response for input
-            rag_response = self.rag_handler.get_rag_response(
-                query=item.input
-            )
-            
-            # Create LLMTestCase using golden data and RAG response
-            test_case = LLMTestCase(
-                input=item.input,              # From golden
-                expected_output=item.expected_output,  # From golden
-                context=item.context,          # From golden
-                actual_output=rag_response     # From RAG
-            )
-            test_cases.append(test_case)
-            
-        return test_cases
\ No newline at end of file
+        # Create LLMTestCase using golden data and RAG response
+        return LLMTestCase(
+            input=golden.input,              # From golden
+            expected_output=golden.expected_output,  # From golden
+            context=golden.context,          # From golden
+            actual_output=rag_response     # From RAG
+        )
\ No newline at end of file
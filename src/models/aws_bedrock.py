@@ -1,22 +1,30 @@
 from deepeval.models import DeepEvalBaseLLM
 from langchain_aws import ChatBedrock
-from typing import Any
-from ..config.evaluation_config import EVALUATOR_MODEL_CONFIG
+from typing import Any, Optional
+from ..config.evaluation_config import EVALUATOR_MODEL_CONFIG, JUDGE_CALL_POLICY_CONFIG
+from ..reporting.telemetry import RunTelemetry, case_query
+from .call_policy import CallPolicy
 
 class AWSBedrock(DeepEvalBaseLLM):
-    def __init__(self, model: ChatBedrock):
+    def __init__(self, model: ChatBedrock, telemetry: Optional[RunTelemetry] = None):
         self.model = model
+        self.telemetry = telemetry or RunTelemetry()
+        self.judge_policy = CallPolicy("judge", telemetry=self.telemetry, **JUDGE_CALL_POLICY_CONFIG)
 
     def load_model(self):
         return self.model
 
     def generate(self, prompt: str) -> str:
         chat_model = self.load_model()
-        return chat_model.invoke(prompt).content
+        return self.judge_policy.call(
+            lambda: chat_model.invoke(prompt), query=case_query.get()
+        ).content
 
     async def a_generate(self, prompt: str) -> str:
         chat_model = self.load_model()
-        res = await chat_model.ainvoke(prompt)
+        res = await self.judge_policy.a_call(
+            lambda: chat_model.ainvoke(prompt), query=case_query.get()
+        )
         return res.content
 
     def get_model_name(self):
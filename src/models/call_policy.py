@@ -0,0 +1,193 @@
+from typing import Any, Awaitable, Callable, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime
+import asyncio
+import threading
+import time
+from ..reporting.telemetry import RunTelemetry
+
+class CallTimeoutError(TimeoutError):
+    """Raised when a call does not complete within its stage deadline"""
+
+class CallPolicy:
+    def __init__(
+        self,
+        stage: str,
+        deadline_s: Optional[float] = None,
+        hedge_percentile: Optional[float] = None,
+        hedge_budget: float = 0.05,
+        min_samples: int = 20,
+        telemetry: Optional[RunTelemetry] = None,
+        max_workers: int = 32
+    ):
+        """
+        Per-stage deadline and hedged-request policy for blocking model/retrieval calls
+
+        A call that has not answered after the stage's hedge_percentile latency
+        gets one duplicate request; whichever reply arrives first wins. Calls
+        that miss the deadline raise CallTimeoutError instead of holding their
+        pipeline slot.
+
+        Args:
+            stage: Call type used for telemetry (e.g. "retrieve", "generate", "judge")
+            deadline_s: Maximum wall-clock seconds per call (None disables the deadline)
+            hedge_percentile: Observed latency percentile after which a duplicate is
+                issued (None disables hedging)
+            hedge_budget: Maximum fraction of calls that may be hedged
+            min_samples: Latency samples required before hedging starts
+            telemetry: Collector for per-call timings and outcomes
+            max_workers: Threads available for in-flight synchronous calls
+        """
+        self.stage = stage
+        self.deadline_s = deadline_s
+        self.hedge_percentile = hedge_percentile
+        self.hedge_budget = hedge_budget
+        self.min_samples = min_samples
+        self.telemetry = telemetry or RunTelemetry()
+        self.max_workers = max_workers
+
+        self._latencies = deque(maxlen=500)
+        self._calls = 0
+        self._hedges = 0
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def hedge_delay(self) -> Optional[float]:
+        """
+        Seconds to wait before hedging, or None if hedging is off or not yet calibrated
+        """
+        if self.hedge_percentile is None:
+            return None
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * self.hedge_percentile / 100))
+        return ordered[index]
+
+    def call(self, fn: Callable[[], Any], query: Optional[str] = None) -> Any:
+        """
+        Run a blocking call under the stage deadline, hedging it if it runs slow
+
+        Args:
+            fn: Zero-argument callable performing the request
+            query: Golden input the call is made for, if known
+
+        Returns:
+            Any: Result of the first request to succeed
+        """
+        started_at, start, deadline = self._begin()
+        executor = self._get_executor()
+        pending = {executor.submit(fn)}
+        hedged = False
+        status = "error"
+        try:
+            delay = self._hedge_delay_before(deadline, start)
+            if delay is not None:
+                done, pending = wait(pending, timeout=delay)
+                if not done and self._take_hedge():
+                    pending.add(executor.submit(fn))
+                    hedged = True
+                pending |= done
+
+            while True:
+                done, pending = wait(pending, timeout=self._remaining(deadline),
+                                     return_when=FIRST_COMPLETED)
+                if not done:
+                    status = "timeout"
+                    raise CallTimeoutError(f"{self.stage} call exceeded {self.deadline_s}s deadline")
+                succeeded = [future for future in done if future.exception() is None]
+                if succeeded:
+                    status = "ok"
+                    return succeeded[0].result()
+                if not pending:
+                    raise next(iter(done)).exception()
+        finally:
+            for future in pending:
+                future.cancel()
+            self._finish(status, hedged, start, started_at, query)
+
+    async def a_call(self, coro_fn: Callable[[], Awaitable[Any]], query: Optional[str] = None) -> Any:
+        """
+        Async counterpart of call(); losing or late requests are cancelled
+
+        Args:
+            coro_fn: Zero-argument callable returning a fresh awaitable request
+            query: Golden input the call is made for, if known
+
+        Returns:
+            Any: Result of the first request to succeed
+        """
+        started_at, start, deadline = self._begin()
+        pending = {asyncio.ensure_future(coro_fn())}
+        hedged = False
+        status = "error"
+        try:
+            delay = self._hedge_delay_before(deadline, start)
+            if delay is not None:
+                done, pending = await asyncio.wait(pending, timeout=delay)
+                if not done and self._take_hedge():
+                    pending.add(asyncio.ensure_future(coro_fn()))
+                    hedged = True
+                pending |= done
+
+            while True:
+                done, pending = await asyncio.wait(pending, timeout=self._remaining(deadline),
+                                                   return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    status = "timeout"
+                    raise CallTimeoutError(f"{self.stage} call exceeded {self.deadline_s}s deadline")
+                succeeded = [task for task in done if task.exception() is None]
+                if succeeded:
+                    status = "ok"
+                    return succeeded[0].result()
+                if not pending:
+                    raise next(iter(done)).exception()
+        finally:
+            for task in pending:
+                task.cancel()
+            self._finish(status, hedged, start, started_at, query)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix=f"{self.stage}-call"
+                )
+            return self._executor
+
+    def _begin(self):
+        with self._lock:
+            self._calls += 1
+        start = time.perf_counter()
+        deadline = start + self.deadline_s if self.deadline_s else None
+        return datetime.now(), start, deadline
+
+    def _hedge_delay_before(self, deadline: Optional[float], start: float) -> Optional[float]:
+        # Hedging only helps if the duplicate still has time to answer
+        delay = self.hedge_delay()
+        if delay is None or (deadline is not None and start + delay >= deadline):
+            return None
+        return delay
+
+    def _remaining(self, deadline: Optional[float]) -> Optional[float]:
+        if deadline is None:
+            return None
+        return max(0.0, deadline - time.perf_counter())
+
+    def _take_hedge(self) -> bool:
+        with self._lock:
+            if self._hedges + 1 > self.hedge_budget * self._calls:
+                return False
+            self._hedges += 1
+            return True
+
+    def _finish(self, status: str, hedged: bool, start: float, started_at: datetime,
+                query: Optional[str]):
+        duration = time.perf_counter() - start
+        if status == "ok":
+            with self._lock:
+                self._latencies.append(duration)
+        self.telemetry.record(self.stage, duration * 1000, status, query, started_at, hedged)
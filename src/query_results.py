@@ -0,0 +1,53 @@
+import argparse
+from src.reporting.results_store import ResultsStore
+
+def print_rows(rows):
+    if not rows:
+        print("No results found.")
+        return
+    columns = list(rows[0].keys())
+    print(" | ".join(columns))
+    for row in rows:
+        print(" | ".join(str(row[column]) for column in columns))
+
+def main():
+    parser = argparse.ArgumentParser(description="Query stored RAG evaluation results")
+    parser.add_argument("--db", default="reports/results.db", help="Path to the results store")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    runs_parser = subparsers.add_parser("runs", help="List recent runs")
+    runs_parser.add_argument("--last", type=int, default=20)
+
+    trend_parser = subparsers.add_parser("trend", help="Score history of a single golden")
+    trend_parser.add_argument("input_query", help="Input query of the golden")
+    trend_parser.add_argument("--last", type=int, default=50)
+    trend_parser.add_argument("--metric", default=None)
+
+    regressions_parser = subparsers.add_parser("regressions", help="Goldens whose score dropped between two runs")
+    regressions_parser.add_argument("--run", type=int, default=None, help="Run to check (default: latest)")
+    regressions_parser.add_argument("--baseline", type=int, default=None, help="Baseline run (default: previous)")
+    regressions_parser.add_argument("--min-drop", type=float, default=0.0)
+
+    timings_parser = subparsers.add_parser("timings", help="Per-stage call latencies of a run")
+    timings_parser.add_argument("run_id", type=int)
+
+    export_parser = subparsers.add_parser("export", help="Export a stored run to CSV")
+    export_parser.add_argument("run_id", type=int)
+    export_parser.add_argument("--output-dir", default="reports")
+
+    args = parser.parse_args()
+
+    with ResultsStore(args.db) as store:
+        if args.command == "runs":
+            print_rows(store.list_runs(args.last))
+        elif args.command == "trend":
+            print_rows(store.score_trend(args.input_query, args.last, args.metric))
+        elif args.command == "regressions":
+            print_rows(store.regressions(args.run, args.baseline, args.min_drop))
+        elif args.command == "timings":
+            print_rows(store.stage_latencies(args.run_id))
+        elif args.command == "export":
+            print(f"Exported: {store.export_csv(args.run_id, args.output_dir)}")
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,17 @@
-from typing import List
-from ..config.rag_config import BEDROCK_CONFIG
+from typing import List, Optional
+from ..config.rag_config import BEDROCK_CONFIG, CALL_POLICY_CONFIG
+from ..config.call_policy_config import bedrock_client_config
+from ..models.call_policy import CallPolicy, CallTimeoutError
 import boto3
 
 class KnowledgeBase:
-    def __init__(self, knowledge_base_id: str):
+    def __init__(self, knowledge_base_id: str, retrieve_policy: Optional[CallPolicy] = None):
         self.knowledge_base_id = knowledge_base_id
+        self.retrieve_policy = retrieve_policy or CallPolicy("retrieve", **CALL_POLICY_CONFIG["retrieve"])
         self.bedrock_agent = boto3.client(
             'bedrock-agent-runtime',
-            region_name=BEDROCK_CONFIG["region_name"]
+            region_name=BEDROCK_CONFIG["region_name"],
+            config=bedrock_client_config(CALL_POLICY_CONFIG["retrieve"]["deadline_s"])
         )
         
     def retrieve_context(self, prompt: str, num_results: int = 3) -> List[str]:
@@ -20,18 +24,24 @@ class KnowledgeBase:
             
         Returns:
             List[str]: Retrieved passages
+            
+        Raises:
+            CallTimeoutError: If retrieval misses its deadline
         """
         try:
-            retrieve_response = self.bedrock_agent.retrieve(
-                knowledgeBaseId=self.knowledge_base_id,
-                retrievalQuery={
-                    'text': prompt
-                },
-                retrievalConfiguration={
-                    'vectorSearchConfiguration': {
-                        'numberOfResults': num_results
+            retrieve_response = self.retrieve_policy.call(
+                lambda: self.bedrock_agent.retrieve(
+                    knowledgeBaseId=self.knowledge_base_id,
+                    retrievalQuery={
+                        'text': prompt
+                    },
+                    retrievalConfiguration={
+                        'vectorSearchConfiguration': {
+                            'numberOfResults': num_results
+                        }
                     }
-                }
+                ),
+                query=prompt
             )
             
             # Extract passages from response
@@ -42,6 +52,8 @@ class KnowledgeBase:
                     passages.append(text)
                     
             return passages
+        except CallTimeoutError:
+            raise
         except Exception as e:
             print(f"Error in retrieval: {str(e)}")
             return []
@@ -3,30 +3,48 @@ import os
 from typing import List, Optional
 from dotenv import load_dotenv
 from .knowledge_base import KnowledgeBase
-from ..config.rag_config import BEDROCK_CONFIG, KNOWLEDGE_BASE_CONFIG, create_bedrock_model
+from ..config.call_policy_config import bedrock_client_config
+from ..models.call_policy import CallPolicy, CallTimeoutError
+from ..reporting.telemetry import RunTelemetry
+from ..config.rag_config import BEDROCK_CONFIG, KNOWLEDGE_BASE_CONFIG, CALL_POLICY_CONFIG, create_bedrock_model
 
 # Load environment variables
 load_dotenv()
 
+class RAGError(RuntimeError):
+    """Raised when retrieval or generation fails, so the failure is not judged as an answer"""
+
 class RAGHandler:
-    def __init__(self, knowledge_base_id: str):
+    def __init__(self, knowledge_base_id: str, telemetry: Optional[RunTelemetry] = None):
         """
         Initialize RAG handler
         
         Args:
             knowledge_base_id: ID of the AWS Knowledge Base
+            telemetry: Optional collector for per-call timings
         """
         self.knowledge_base_id = knowledge_base_id
-        self.knowledge_base = KnowledgeBase(knowledge_base_id)
+        self.telemetry = telemetry or RunTelemetry()
+        
+        # Deadlines and hedged requests per stage
+        self.retrieve_policy = CallPolicy(
+            "retrieve", telemetry=self.telemetry, **CALL_POLICY_CONFIG["retrieve"]
+        )
+        self.generate_policy = CallPolicy(
+            "generate", telemetry=self.telemetry, **CALL_POLICY_CONFIG["generate"]
+        )
+        self.knowledge_base = KnowledgeBase(knowledge_base_id, self.retrieve_policy)
         
         # Initialize Bedrock clients
         self.bedrock_runtime = boto3.client(
             'bedrock-runtime', 
-            region_name=BEDROCK_CONFIG["region_name"]
+            region_name=BEDROCK_CONFIG["region_name"],
+            config=bedrock_client_config(CALL_POLICY_CONFIG["generate"]["deadline_s"])
         )
         self.bedrock_agent = boto3.client(
             'bedrock-agent-runtime', 
-            region_name=BEDROCK_CONFIG["region_name"]
+            region_name=BEDROCK_CONFIG["region_name"],
+            config=bedrock_client_config(CALL_POLICY_CONFIG["retrieve"]["deadline_s"])
         )
         
         # Store configurations
@@ -44,19 +62,26 @@ class RAGHandler:
             
         Returns:
             str: Generated response from RAG
+            
+        Raises:
+            CallTimeoutError: If retrieval or generation misses its deadline
+            RAGError: If retrieval or generation fails for any other reason
         """
         # Step 1: Retrieve context from knowledge center using Bedrock
         try:
-            retrieve_response = self.bedrock_agent.retrieve(
-                knowledgeBaseId=self.knowledge_base_id,
-                retrievalQuery={
-                    'text': query
-                },
-                retrievalConfiguration={
-                    'vectorSearchConfiguration': {
-                        'numberOfResults': KNOWLEDGE_BASE_CONFIG["num_results"]
+            retrieve_response = self.retrieve_policy.call(
+                lambda: self.bedrock_agent.retrieve(
+                    knowledgeBaseId=self.knowledge_base_id,
+                    retrievalQuery={
+                        'text': query
+                    },
+                    retrievalConfiguration={
+                        'vectorSearchConfiguration': {
+                            'numberOfResults': KNOWLEDGE_BASE_CONFIG["num_results"]
+                        }
                     }
-                }
+                ),
+                query=query
             )
             
             # Extract passages from response
@@ -69,9 +94,12 @@ class RAGHandler:
             # Format retrieved context
             formatted_context = self.knowledge_base.format_context(retrieved_contexts)
             
+        except CallTimeoutError:
+            # Timeouts are infrastructure failures, not answers to be judged
+            raise
         except Exception as e:
             print(f"Error in context retrieval: {str(e)}")
-            return "Error: Failed to retrieve context"
+            raise RAGError(f"Failed to retrieve context: {str(e)}") from e
 
         # Step 2: Create prompt with retrieved context
         prompt = f"""Based on the following context, please answer the question.
@@ -86,11 +114,16 @@ Answer:"""
         
         # Step 3: Get response from RAG model
         try:
-            response = self.model.invoke(prompt)
+            response = self.generate_policy.call(
+                lambda: self.model.invoke(prompt),
+                query=query
+            )
             return response.content
+        except CallTimeoutError:
+            raise
         except Exception as e:
             print(f"Error in RAG response generation: {str(e)}")
-            return "Error: Failed to generate response"
+            raise RAGError(f"Failed to generate response: {str(e)}") from e
 
     def process_test_case(self, input_query: str) -> str:
         """
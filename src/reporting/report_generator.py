@@ -1,51 +1,56 @@
-from typing import List, Dict
+from typing import List, Dict, Optional
 from pathlib import Path
 import json
 from datetime import datetime
 import pandas as pd
+from .results_store import ResultsStore
+from .telemetry import RunTelemetry
 
 class ReportGenerator:
-    def __init__(self, output_dir: str = "reports"):
-        self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(exist_ok=True)
-        
-    def generate_summary_report(self, evaluation_results) -> dict:
+    def __init__(self, output_dir: str = "reports", results_db: Optional[str] = None,
+                 export_csv: bool = True, batch_size: int = 50):
         """
-        Generate a summary of evaluation results
-        
         Args:
-            evaluation_results: Results from evaluator
-            
-        Returns:
-            dict: Summary statistics
+            output_dir: Directory for CSV reports
+            results_db: SQLite results store path (defaults to <output_dir>/results.db)
+            export_csv: Whether to also write per-run CSV reports
+            batch_size: Streamed results buffered before each write to the results store
         """
-        # Calculate overall statistics
-        total_cases = len(evaluation_results.test_results)
-        passed_cases = sum(1 for test_result in evaluation_results.test_results 
-                         if all(metric.success for metric in test_result.metrics_data))
-        
-        # Calculate average score across all test cases
-        total_score = sum(test_result.metrics_data[0].score 
-                         for test_result in evaluation_results.test_results)
-        avg_score = total_score / total_cases if total_cases > 0 else 0
-        
-        # Get model info from first test case (these should be constant)
-        model_info = evaluation_results.test_results[0].metrics_data[0]
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(exist_ok=True)
+        self.results_db = results_db or str(self.output_dir / "results.db")
+        self.export_csv = export_csv
+        self.batch_size = batch_size
+        
+        # State of the run being streamed in by the evaluation pipeline
+        self._store: Optional[ResultsStore] = None
+        self._run_id: Optional[int] = None
+        self._telemetry: Optional[RunTelemetry] = None
+        self._pending_rows: List[Dict] = []
+        self._streamed_totals = {"total_cases": 0, "passed_cases": 0, "errored_cases": 0, "total_score": 0.0}
+        self._streamed_model_info = None
+        
+    def _build_summary(self, total_cases: int, passed_cases: int, total_score: float, model_info,
+                       errored_cases: int = 0) -> dict:
+        # Failed cases count against the pass rate but have no score to average
+        scored_cases = total_cases - errored_cases
+        avg_score = total_score / scored_cases if scored_cases > 0 else 0
         
         # Calculate overall pass/fail based on pass rate and threshold
         pass_rate = passed_cases / total_cases if total_cases > 0 else 0
-        overall_success = pass_rate >= model_info.threshold
+        overall_success = model_info is not None and pass_rate >= model_info.threshold
         
         # Create summary dictionary for run_evaluation.py compatibility
         summary = {
             "total_test_cases": total_cases,
             "passed_test_cases": passed_cases,
+            "errored_test_cases": errored_cases,
             "pass_rate": pass_rate,
-            "metric_name": model_info.name,
+            "metric_name": model_info.name if model_info else None,
             "score": avg_score,
-            "threshold": model_info.threshold,
+            "threshold": model_info.threshold if model_info else None,
             "success": overall_success,
-            "model_used": model_info.evaluation_model,
+            "model_used": model_info.evaluation_model if model_info else None,
             "analysis": f"Overall pass rate: {pass_rate:.2%}. Average score: {avg_score:.4f}",
             "evaluation_timestamp": datetime.now().isoformat()
         }
@@ -58,62 +63,141 @@ class ReportGenerator:
                 total_cases,
                 f"{avg_score:.4f}",  # Using average score across all test cases
                 'PASS' if overall_success else 'FAIL',  # Based on overall pass rate vs threshold
-                model_info.evaluation_model
+                summary["model_used"]
             ]
         }
         
         return summary
     
-    def generate_detailed_report(self, evaluation_results) -> List[Dict]:
-        """
-        Generate detailed report for each test case
-        
-        Args:
-            evaluation_results: Results from evaluator
-            
-        Returns:
-            List[Dict]: Detailed results for each test case
-        """
-        detailed_results = []
-        
-        for idx, test_result in enumerate(evaluation_results.test_results, 1):
-            metric_result = test_result.metrics_data[0]
-            result = {
-                'Test ID': idx,
+    def _detailed_row(self, test_id: int, test_result) -> Dict:
+        if not test_result.metrics_data:
+            # Case failed before it could be scored
+            return {
+                'Test ID': test_id,
                 'Input Query': test_result.input,
                 'Expected Output': test_result.expected_output,
                 'Actual Output': test_result.actual_output,
-                'Score': f"{metric_result.score:.4f}",
-                'Threshold': metric_result.threshold,
-                'Success': metric_result.success,
-                'Reason': metric_result.reason
+                'Metric': None,
+                'Score': None,
+                'Threshold': None,
+                'Success': False,
+                'Reason': None,
+                'Status': getattr(test_result, 'status', 'error'),
+                'Error': getattr(test_result, 'error', None)
             }
-            detailed_results.append(result)
-            
-        return detailed_results
-        
-    def save_reports(self, summary: dict, detailed_results: List[Dict]):
+        metric_result = test_result.metrics_data[0]
+        return {
+            'Test ID': test_id,
+            'Input Query': test_result.input,
+            'Expected Output': test_result.expected_output,
+            'Actual Output': test_result.actual_output,
+            'Metric': metric_result.name,
+            'Score': f"{metric_result.score:.4f}",
+            'Threshold': metric_result.threshold,
+            'Success': metric_result.success,
+            'Reason': metric_result.reason,
+            'Status': 'ok',
+            'Error': None
+        }
+    
+    def start_run(self, telemetry: Optional[RunTelemetry] = None,
+                  started_at: Optional[datetime] = None):
         """
-        Save reports to CSV files
+        Open a run in the results store that add_test_result will stream into
         
         Args:
-            summary: Summary statistics
-            detailed_results: Detailed test case results
+            telemetry: Collector whose call timings are stored with each batch
+            started_at: When the evaluation run started (defaults to now)
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # Create DataFrames using notebook format
-        summary_df = pd.DataFrame(self.summary_df_format)
-        detailed_df = pd.DataFrame(detailed_results)
+        self._store = ResultsStore(self.results_db)
+        self._run_id = self._store.begin_run(started_at)
+        self._telemetry = telemetry
+        self._pending_rows = []
+        self._streamed_totals = {"total_cases": 0, "passed_cases": 0, "errored_cases": 0, "total_score": 0.0}
+        self._streamed_model_info = None
+    
+    def add_test_result(self, test_id: int, test_result):
+        """
+        Fold a single result from the evaluation pipeline into the running report;
+        rows are written to the results store in batches rather than kept in memory
         
-        # Save as CSV files
-        summary_file = self.output_dir / f"summary_report_{timestamp}.csv"
-        detailed_file = self.output_dir / f"detailed_report_{timestamp}.csv"
+        Args:
+            test_id: Position of the golden in the golden set (1-based)
+            test_result: Result for one test case
+        """
+        self._streamed_totals["total_cases"] += 1
+        if not test_result.metrics_data:
+            self._streamed_totals["errored_cases"] += 1
+        else:
+            if all(metric.success for metric in test_result.metrics_data):
+                self._streamed_totals["passed_cases"] += 1
+            self._streamed_totals["total_score"] += test_result.metrics_data[0].score
+            if self._streamed_model_info is None:
+                self._streamed_model_info = test_result.metrics_data[0]
+                
+        self._pending_rows.append(self._detailed_row(test_id, test_result))
+        if len(self._pending_rows) >= self.batch_size:
+            self._flush()
+    
+    def _flush(self):
+        self._store.add_cases(self._run_id, self._pending_rows)
+        self._pending_rows = []
+        if self._telemetry is not None:
+            self._store.add_timings(self._run_id, self._telemetry.drain())
+    
+    def finish_run(self) -> dict:
+        """
+        Flush remaining results, store the run summary and, optionally, export CSV reports
         
-        # Save with auto-adjusted column widths
-        summary_df.to_csv(summary_file, index=False)
-        detailed_df.to_csv(detailed_file, index=False)
+        Returns:
+            dict: Summary statistics
+        """
+        try:
+            self._flush()
+            summary = self._build_summary(
+                self._streamed_totals["total_cases"],
+                self._streamed_totals["passed_cases"],
+                self._streamed_totals["total_score"],
+                self._streamed_model_info,
+                self._streamed_totals["errored_cases"]
+            )
+            self._store.finish_run(self._run_id, summary)
+            print(f"Results stored as run {self._run_id} in {self.results_db}")
+            
+            if self.export_csv:
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                summary_file = self.output_dir / f"summary_report_{timestamp}.csv"
+                detailed_file = self.output_dir / f"detailed_report_{timestamp}.csv"
+                
+                # Detailed rows are read back from the store in golden order
+                pd.DataFrame(self.summary_df_format).to_csv(summary_file, index=False)
+                self._store.export_csv(self._run_id, output_file=str(detailed_file))
+                
+                print(f"Reports generated successfully:")
+                print(f"Summary: {summary_file}")
+                print(f"Detailed: {detailed_file}")
+        finally:
+            self._store.close()
+            self._store = None
+            
+        return summary
+    
+    def abort_run(self, error: Exception):
+        """
+        Keep the results collected so far and mark the run as failed in the results store
         
-        print(f"Reports generated successfully:")
-        print(f"Summary: {summary_file}")
-        print(f"Detailed: {detailed_file}")
\ No newline at end of file
+        Args:
+            error: Exception that stopped the run
+        """
+        if self._store is None:
+            return
+        try:
+            self._flush()
+        except Exception as e:
+            print(f"Error saving partial results: {str(e)}")
+        finally:
+            self._store.fail_run(self._run_id, str(error))
+            self._store.close()
+            self._store = None
+        print(f"Run {self._run_id} failed after {self._streamed_totals['total_cases']} test cases; "
+              f"partial results kept in {self.results_db}")
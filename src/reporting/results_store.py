@@ -0,0 +1,376 @@
+from typing import List, Dict, Optional
+from pathlib import Path
+from datetime import datetime
+import hashlib
+import sqlite3
+import pandas as pd
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT,
+    evaluated_at TEXT,
+    status TEXT NOT NULL DEFAULT 'running',
+    error TEXT,
+    model_used TEXT,
+    metric_name TEXT,
+    threshold REAL,
+    total_test_cases INTEGER,
+    passed_test_cases INTEGER,
+    errored_test_cases INTEGER,
+    pass_rate REAL,
+    score REAL,
+    success INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS cases (
+    run_id INTEGER NOT NULL REFERENCES runs(run_id),
+    test_id INTEGER NOT NULL,
+    case_key TEXT NOT NULL,
+    input_key TEXT NOT NULL,
+    input TEXT NOT NULL,
+    expected_output TEXT,
+    actual_output TEXT,
+    status TEXT NOT NULL,
+    error TEXT,
+    PRIMARY KEY (run_id, test_id)
+);
+
+CREATE TABLE IF NOT EXISTS metrics (
+    run_id INTEGER NOT NULL REFERENCES runs(run_id),
+    test_id INTEGER NOT NULL,
+    metric_name TEXT NOT NULL,
+    score REAL,
+    threshold REAL,
+    success INTEGER,
+    reason TEXT,
+    PRIMARY KEY (run_id, test_id, metric_name)
+);
+
+CREATE TABLE IF NOT EXISTS timings (
+    run_id INTEGER NOT NULL REFERENCES runs(run_id),
+    input_key TEXT,
+    stage TEXT NOT NULL,
+    status TEXT NOT NULL,
+    hedged INTEGER NOT NULL DEFAULT 0,
+    started_at TEXT,
+    duration_ms REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_cases_key ON cases (case_key, run_id);
+CREATE INDEX IF NOT EXISTS idx_cases_input ON cases (input_key, run_id);
+CREATE INDEX IF NOT EXISTS idx_timings_run_stage ON timings (run_id, stage);
+"""
+
+def input_key(input_query: str) -> str:
+    """
+    Identifier for an input query, used to tie timings and trends to goldens
+    """
+    return hashlib.sha1(input_query.encode('utf-8')).hexdigest()[:16]
+
+def case_key(input_query: str, expected_output: str) -> str:
+    """
+    Stable identifier for a golden across runs, derived from its input and expected output.
+    Rows are keyed by test ID within a run, so duplicate goldens are stored side by side.
+    """
+    return hashlib.sha1(f"{input_query}\0{expected_output}".encode('utf-8')).hexdigest()[:16]
+
+class ResultsStore:
+    def __init__(self, db_path: str = "reports/results.db"):
+        """
+        Indexed SQLite store for evaluation results across runs
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def begin_run(self, started_at: Optional[datetime] = None) -> int:
+        """
+        Register a new run whose cases will be added as they complete
+
+        Args:
+            started_at: When the evaluation run started (defaults to now)
+
+        Returns:
+            int: ID of the new run
+        """
+        with self.conn:
+            return self._insert_run(started_at or datetime.now())
+
+    def add_cases(self, run_id: int, detailed_results: List[Dict]):
+        """
+        Append a batch of detailed results to a run in one transaction
+
+        Failed cases are stored without a metric row, so they show up in
+        trends and regressions by status rather than as a low score.
+        """
+        with self.conn:
+            self._insert_cases(run_id, detailed_results)
+
+    def add_timings(self, run_id: int, call_timings: List[Dict]):
+        """
+        Append a batch of per-call timing records to a run in one transaction
+        """
+        with self.conn:
+            self._insert_timings(run_id, call_timings)
+
+    def finish_run(self, run_id: int, summary: dict):
+        """
+        Store the summary statistics of a completed run
+        """
+        with self.conn:
+            self._update_run(run_id, summary)
+
+    def fail_run(self, run_id: int, error: str):
+        """
+        Mark a run as failed; cases stored before the failure are kept
+        """
+        with self.conn:
+            self.conn.execute(
+                "UPDATE runs SET status = 'failed', error = ? WHERE run_id = ?",
+                (error, run_id)
+            )
+
+    def _insert_run(self, started_at: Optional[datetime]) -> int:
+        cursor = self.conn.execute(
+            "INSERT INTO runs (started_at) VALUES (?)",
+            (started_at.isoformat() if started_at else None,)
+        )
+        return cursor.lastrowid
+
+    def _update_run(self, run_id: int, summary: dict):
+        self.conn.execute(
+            """UPDATE runs SET status = 'finished', evaluated_at = ?, model_used = ?, metric_name = ?, threshold = ?,
+                               total_test_cases = ?, passed_test_cases = ?, errored_test_cases = ?,
+                               pass_rate = ?, score = ?, success = ?
+               WHERE run_id = ?""",
+            (
+                summary.get("evaluation_timestamp", datetime.now().isoformat()),
+                str(summary["model_used"]) if summary["model_used"] is not None else None,
+                summary["metric_name"],
+                summary["threshold"],
+                summary["total_test_cases"],
+                summary["passed_test_cases"],
+                summary.get("errored_test_cases", 0),
+                summary["pass_rate"],
+                summary["score"],
+                int(bool(summary["success"])),
+                run_id
+            )
+        )
+
+    def _insert_cases(self, run_id: int, detailed_results: List[Dict]):
+        case_rows = []
+        metric_rows = []
+        for row in detailed_results:
+            key = case_key(row['Input Query'], row['Expected Output'])
+            status = row.get('Status', 'ok')
+            case_rows.append((
+                run_id, row['Test ID'], key, input_key(row['Input Query']), row['Input Query'],
+                row['Expected Output'], row['Actual Output'], status, row.get('Error')
+            ))
+            if status == 'ok':
+                metric_rows.append((
+                    run_id, row['Test ID'], row['Metric'], float(row['Score']),
+                    row['Threshold'], int(bool(row['Success'])), row['Reason']
+                ))
+        self.conn.executemany(
+            "INSERT INTO cases VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", case_rows
+        )
+        self.conn.executemany(
+            "INSERT INTO metrics VALUES (?, ?, ?, ?, ?, ?, ?)", metric_rows
+        )
+
+    def _insert_timings(self, run_id: int, call_timings: List[Dict]):
+        timing_rows = [
+            (
+                run_id,
+                input_key(timing["query"]) if timing.get("query") else None,
+                timing["stage"],
+                timing["status"],
+                int(bool(timing.get("hedged"))),
+                timing.get("started_at"),
+                timing["duration_ms"]
+            )
+            for timing in call_timings
+        ]
+        self.conn.executemany(
+            "INSERT INTO timings VALUES (?, ?, ?, ?, ?, ?, ?)", timing_rows
+        )
+
+    def list_runs(self, last: int = 20) -> List[Dict]:
+        """
+        Return the most recent runs, newest first
+        """
+        rows = self.conn.execute(
+            "SELECT * FROM runs ORDER BY run_id DESC LIMIT ?", (last,)
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def score_trend(self, input_query: str, last: int = 50,
+                    metric_name: Optional[str] = None) -> List[Dict]:
+        """
+        Score history of a single golden, newest run first
+
+        Runs where the golden timed out or errored are included with their
+        status and an empty score, so gaps in the trend stay visible.
+
+        Args:
+            input_query: Input query of the golden
+            last: Maximum number of runs to return
+            metric_name: Restrict to one metric (defaults to all metrics)
+
+        Returns:
+            List[Dict]: One row per run for each golden with this input
+        """
+        key = input_key(input_query)
+        metric_filter = " AND m.metric_name = ?" if metric_name else ""
+        params = ([metric_name] if metric_name else []) + [key, key, last]
+        rows = self.conn.execute(
+            f"""SELECT c.run_id, r.started_at, c.test_id, c.case_key, c.status,
+                       m.metric_name, m.score, m.success
+                FROM cases c
+                JOIN runs r ON r.run_id = c.run_id
+                LEFT JOIN metrics m
+                  ON m.run_id = c.run_id AND m.test_id = c.test_id{metric_filter}
+                WHERE c.input_key = ?
+                  AND c.run_id IN (
+                      SELECT DISTINCT run_id FROM cases WHERE input_key = ?
+                      ORDER BY run_id DESC LIMIT ?
+                  )
+                ORDER BY c.run_id DESC, c.test_id""",
+            params
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def regressions(self, run_id: Optional[int] = None, baseline_run_id: Optional[int] = None,
+                    min_drop: float = 0.0) -> List[Dict]:
+        """
+        Goldens whose score dropped between a baseline run and a later run,
+        plus goldens scored in the baseline that timed out or errored in the later run
+
+        Args:
+            run_id: Run to check (defaults to the latest finished run)
+            baseline_run_id: Run to compare against (defaults to the finished run before run_id)
+            min_drop: Minimum score decrease to report
+
+        Returns:
+            List[Dict]: Regressed cases, failed cases first, then largest drop first
+        """
+        # Default to finished runs only; a failed or interrupted run is incomplete
+        if run_id is None:
+            row = self.conn.execute(
+                "SELECT MAX(run_id) FROM runs WHERE status = 'finished'"
+            ).fetchone()
+            run_id = row[0]
+        if baseline_run_id is None and run_id is not None:
+            row = self.conn.execute(
+                "SELECT MAX(run_id) FROM runs WHERE run_id < ? AND status = 'finished'",
+                (run_id,)
+            ).fetchone()
+            baseline_run_id = row[0]
+        if run_id is None or baseline_run_id is None:
+            return []
+
+        # Duplicate goldens share a case_key; pair them across runs by order of appearance
+        rows = self.conn.execute(
+            """WITH numbered AS (
+                   SELECT run_id, test_id, case_key, input, status,
+                          ROW_NUMBER() OVER (PARTITION BY run_id, case_key ORDER BY test_id) AS occurrence
+                   FROM cases WHERE run_id IN (?, ?)
+               ),
+               pairs AS (
+                   SELECT c.input, c.test_id, c.status, b.test_id AS baseline_test_id
+                   FROM numbered c
+                   JOIN numbered b
+                     ON b.run_id = ? AND b.case_key = c.case_key AND b.occurrence = c.occurrence
+                   WHERE c.run_id = ? AND b.status = 'ok'
+               )
+               SELECT * FROM (
+                   SELECT p.input, p.test_id, p.status, m.metric_name,
+                          bm.score AS baseline_score, m.score AS score,
+                          bm.score - m.score AS drop_by,
+                          bm.success AS baseline_success, m.success AS success
+                   FROM pairs p
+                   JOIN metrics m ON m.run_id = ? AND m.test_id = p.test_id
+                   JOIN metrics bm
+                     ON bm.run_id = ? AND bm.test_id = p.baseline_test_id
+                    AND bm.metric_name = m.metric_name
+                   WHERE bm.score - m.score > ? OR (bm.success = 1 AND m.success = 0)
+                   UNION ALL
+                   SELECT p.input, p.test_id, p.status, bm.metric_name,
+                          bm.score AS baseline_score, NULL AS score, NULL AS drop_by,
+                          bm.success AS baseline_success, 0 AS success
+                   FROM pairs p
+                   JOIN metrics bm ON bm.run_id = ? AND bm.test_id = p.baseline_test_id
+                   WHERE p.status != 'ok'
+               )
+               ORDER BY status = 'ok', drop_by DESC""",
+            (run_id, baseline_run_id, baseline_run_id, run_id,
+             run_id, baseline_run_id, min_drop, baseline_run_id)
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def stage_latencies(self, run_id: int) -> List[Dict]:
+        """
+        Per-stage call counts and latency statistics for a run
+        """
+        rows = self.conn.execute(
+            """SELECT stage, status, COUNT(*) AS calls, SUM(hedged) AS hedged,
+                      AVG(duration_ms) AS avg_ms, MAX(duration_ms) AS max_ms
+               FROM timings WHERE run_id = ?
+               GROUP BY stage, status ORDER BY stage, status""",
+            (run_id,)
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def export_csv(self, run_id: int, output_dir: str = "reports",
+                   output_file: Optional[str] = None) -> Path:
+        """
+        Export the detailed results of a stored run to CSV
+
+        Args:
+            run_id: Run to export
+            output_dir: Directory to write the CSV file to
+            output_file: Exact path to write to (overrides output_dir)
+
+        Returns:
+            Path: Path of the written CSV file
+        """
+        detailed_df = pd.read_sql_query(
+            """SELECT c.test_id AS "Test ID", c.input AS "Input Query",
+                      c.expected_output AS "Expected Output", c.actual_output AS "Actual Output",
+                      m.metric_name AS "Metric", m.score AS "Score", m.threshold AS "Threshold",
+                      COALESCE(m.success, 0) AS "Success", m.reason AS "Reason",
+                      c.status AS "Status", c.error AS "Error"
+               FROM cases c LEFT JOIN metrics m ON m.run_id = c.run_id AND m.test_id = c.test_id
+               WHERE c.run_id = ? ORDER BY c.test_id""",
+            self.conn,
+            params=(run_id,)
+        )
+        # Match the formatting of ReportGenerator's detailed rows
+        detailed_df["Score"] = detailed_df["Score"].map(
+            lambda score: f"{score:.4f}" if pd.notna(score) else None
+        )
+        detailed_df["Success"] = detailed_df["Success"].astype(bool)
+        output_file = Path(output_file) if output_file else Path(output_dir) / f"detailed_report_run{run_id}.csv"
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        detailed_df.to_csv(output_file, index=False)
+        return output_file
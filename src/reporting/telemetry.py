@@ -0,0 +1,65 @@
+from typing import List, Dict, Optional
+from contextvars import ContextVar
+from datetime import datetime
+import threading
+
+# Golden input of the case being judged, for calls made on its behalf deep inside deepeval
+case_query: ContextVar[Optional[str]] = ContextVar("case_query", default=None)
+
+class RunTelemetry:
+    def __init__(self):
+        """
+        Thread-safe collector of per-call timings for a single evaluation run
+        """
+        self._lock = threading.Lock()
+        self.call_timings: List[Dict] = []
+        self._status_counts: Dict[str, int] = {}
+        self._hedged_calls = 0
+
+    def record(self, stage: str, duration_ms: float, status: str = "ok",
+               query: Optional[str] = None, started_at: Optional[datetime] = None,
+               hedged: bool = False):
+        """
+        Record a single model or retrieval call
+
+        Args:
+            stage: Call type (e.g. "retrieve", "generate", "judge")
+            duration_ms: Wall-clock duration of the call in milliseconds
+            status: Outcome of the call ("ok", "timeout" or "error")
+            query: Golden input the call was made for, if known
+            started_at: When the call was issued (defaults to now)
+            hedged: Whether a duplicate request was issued, whatever the outcome
+        """
+        with self._lock:
+            self._status_counts[status] = self._status_counts.get(status, 0) + 1
+            self._hedged_calls += int(hedged)
+            self.call_timings.append({
+                "stage": stage,
+                "query": query,
+                "status": status,
+                "hedged": hedged,
+                "duration_ms": duration_ms,
+                "started_at": (started_at or datetime.now()).isoformat()
+            })
+
+    def drain(self) -> List[Dict]:
+        """
+        Return and clear the timings recorded so far, so long runs can persist them in batches
+        """
+        with self._lock:
+            timings, self.call_timings = self.call_timings, []
+        return timings
+
+    def status_counts(self) -> Dict[str, int]:
+        """
+        Number of recorded calls per outcome over the whole run, e.g. {"ok": 120, "timeout": 1}
+        """
+        with self._lock:
+            return dict(self._status_counts)
+
+    def hedged_calls(self) -> int:
+        """
+        Number of calls over the whole run that issued a hedged duplicate
+        """
+        with self._lock:
+            return self._hedged_calls
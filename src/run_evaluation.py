@@ -1,43 +1,55 @@
+from datetime import datetime
 from src.config.rag_config import KNOWLEDGE_BASE_CONFIG
 from src.config.evaluation_config import create_evaluator_model
 from src.data.data_loader import get_data_loader
 from src.rag.rag_handler import RAGHandler
 from src.evaluation.test_case_generator import TestCaseGenerator
 from src.evaluation.evaluator import Evaluator
+from src.evaluation.pipeline import EvaluationPipeline
 from src.reporting.report_generator import ReportGenerator
+from src.reporting.telemetry import RunTelemetry
 
 def main():
+    run_started_at = datetime.now()
+    
     # Initialize components
     data_loader = get_data_loader()
-    rag_handler = RAGHandler(KNOWLEDGE_BASE_CONFIG["knowledge_base_id"])  # Uses its own RAG model
+    telemetry = RunTelemetry()  # Shared per-call timings for the results store
+    rag_handler = RAGHandler(KNOWLEDGE_BASE_CONFIG["knowledge_base_id"], telemetry)  # Uses its own RAG model
     test_generator = TestCaseGenerator(rag_handler, data_loader)
     
     # Create evaluator with separate model
     eval_model = create_evaluator_model()  # Uses model specified in AWS_EVALUATOR_MODEL_ID
-    evaluator = Evaluator(eval_model)
+    evaluator = Evaluator(eval_model, telemetry)
     report_generator = ReportGenerator()
 
-    # Generate test cases
-    print("Generating test cases...")
-    test_cases = test_generator.generate_test_cases()
-
-    # Run evaluation
-    print("Running evaluation...")
-    evaluation_results = evaluator.evaluate_test_cases(test_cases)
+    # Generate and evaluate test cases as a streaming pipeline,
+    # writing results to the store as they complete
+    print("Generating and evaluating test cases...")
+    report_generator.start_run(telemetry, run_started_at)
+    pipeline = EvaluationPipeline(test_generator, evaluator)
+    try:
+        pipeline.run(on_result=report_generator.add_test_result)
+    except BaseException as e:
+        # Keep what was evaluated before the failure (or Ctrl+C) and mark the run failed
+        report_generator.abort_run(e)
+        raise
 
     # Generate reports
     print("Generating reports...")
-    summary = report_generator.generate_summary_report(evaluation_results)
-    details = report_generator.generate_detailed_report(evaluation_results)
-    
-    # Save reports
-    report_generator.save_reports(summary, details)
+    summary = report_generator.finish_run()
     
     # Print summary
     print("\nEvaluation Summary:")
     print(f"Total Test Cases: {summary['total_test_cases']}")
     print(f"Passed Test Cases: {summary['passed_test_cases']}")
+    print(f"Failed To Evaluate: {summary['errored_test_cases']}")
     print(f"Pass Rate: {summary['pass_rate']:.2%}")
+    
+    # Print tail-latency telemetry
+    call_counts = telemetry.status_counts()
+    print(f"Hedged Calls: {telemetry.hedged_calls()}")
+    print(f"Timed Out Calls: {call_counts.get('timeout', 0)}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
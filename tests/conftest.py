@@ -0,0 +1,7 @@
+import os
+
+# Config modules validate these at import time; tests never reach AWS
+os.environ.setdefault("AWS_EVALUATOR_REGION", "us-east-1")
+os.environ.setdefault("AWS_EVALUATOR_MODEL_ID", "test-evaluator-model")
+os.environ.setdefault("AWS_BEDROCK_REGION", "us-east-1")
+os.environ.setdefault("AWS_BEDROCK_MODEL_ID", "test-rag-model")
@@ -0,0 +1,114 @@
+import asyncio
+import threading
+import time
+import pytest
+from src.models.call_policy import CallPolicy, CallTimeoutError
+from src.reporting.telemetry import RunTelemetry
+
+def make_policy(**overrides) -> CallPolicy:
+    settings = {
+        "stage": "generate",
+        "deadline_s": 2.0,
+        "hedge_percentile": 50,
+        "hedge_budget": 1.0,
+        "min_samples": 3,
+        "telemetry": RunTelemetry()
+    }
+    settings.update(overrides)
+    return CallPolicy(**settings)
+
+def warm_up(policy: CallPolicy, latency_s: float = 0.01):
+    for _ in range(policy.min_samples):
+        policy.call(lambda: time.sleep(latency_s))
+
+class SlowFirstCall:
+    """Callable whose first invocation is slow (and optionally fails); later ones answer at once"""
+    def __init__(self, first_delay_s: float, first_error: Exception = None):
+        self.first_delay_s = first_delay_s
+        self.first_error = first_error
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.calls += 1
+            attempt = self.calls
+        if attempt == 1:
+            time.sleep(self.first_delay_s)
+            if self.first_error is not None:
+                raise self.first_error
+            return "primary"
+        return "hedge"
+
+def test_deadline_raises_and_records_timeout():
+    policy = make_policy(deadline_s=0.1, hedge_percentile=None)
+
+    start = time.perf_counter()
+    with pytest.raises(CallTimeoutError):
+        policy.call(lambda: time.sleep(1.0), query="q1")
+
+    assert time.perf_counter() - start < 0.5
+    timing = policy.telemetry.call_timings[-1]
+    assert timing["status"] == "timeout"
+    assert timing["query"] == "q1"
+    assert policy.telemetry.status_counts() == {"timeout": 1}
+
+def test_async_deadline_raises_and_records_timeout():
+    policy = make_policy(deadline_s=0.1, hedge_percentile=None)
+
+    with pytest.raises(CallTimeoutError):
+        asyncio.run(policy.a_call(lambda: asyncio.sleep(1.0)))
+
+    assert policy.telemetry.status_counts() == {"timeout": 1}
+
+def test_no_hedge_before_min_samples():
+    policy = make_policy()
+    slow = SlowFirstCall(first_delay_s=0.2)
+
+    assert policy.call(slow) == "primary"
+
+    assert slow.calls == 1
+    assert policy.telemetry.hedged_calls() == 0
+
+def test_hedge_after_min_samples():
+    policy = make_policy()
+    warm_up(policy)
+    slow = SlowFirstCall(first_delay_s=0.5)
+
+    assert policy.call(slow) == "hedge"
+
+    assert slow.calls == 2
+    assert policy.telemetry.hedged_calls() == 1
+    assert policy.telemetry.call_timings[-1]["hedged"] is True
+
+def test_hedges_stay_within_budget():
+    policy = make_policy(hedge_budget=0.25)
+    warm_up(policy)
+
+    for _ in range(5):
+        policy.call(SlowFirstCall(first_delay_s=0.1))
+
+    total_calls = policy.min_samples + 5
+    assert 0 < policy.telemetry.hedged_calls() <= 0.25 * total_calls
+
+def test_first_success_wins_when_primary_fails():
+    policy = make_policy()
+    warm_up(policy)
+    failing = SlowFirstCall(first_delay_s=0.1, first_error=RuntimeError("throttled"))
+
+    assert policy.call(failing) == "hedge"
+
+    timing = policy.telemetry.call_timings[-1]
+    assert timing["status"] == "ok"
+    assert timing["hedged"] is True
+
+def test_error_is_raised_when_every_request_fails():
+    policy = make_policy(hedge_percentile=None)
+
+    def fail():
+        raise RuntimeError("throttled")
+
+    with pytest.raises(RuntimeError, match="throttled"):
+        policy.call(fail)
+
+    assert policy.telemetry.status_counts() == {"error": 1}
@@ -0,0 +1,92 @@
+import threading
+import time
+from types import SimpleNamespace
+import pytest
+
+pytest.importorskip("deepeval")
+pytest.importorskip("langchain_aws")
+pytest.importorskip("boto3")
+
+from src.data.data_loader import GoldenTestCase
+from src.evaluation.evaluator import CaseResult, MetricResult
+from src.evaluation.pipeline import EvaluationPipeline
+from src.models.call_policy import CallTimeoutError
+
+class FakeDataLoader:
+    def __init__(self, goldens):
+        self.goldens = goldens
+
+    def load_golden_testcases(self):
+        return self.goldens
+
+class FakeTestGenerator:
+    """Answers every golden at once, failing the inputs listed in failures"""
+    def __init__(self, goldens, failures=None):
+        self.data_loader = FakeDataLoader(goldens)
+        self.failures = failures or {}
+
+    def create_test_case(self, golden):
+        if golden.input in self.failures:
+            raise self.failures[golden.input]
+        return SimpleNamespace(
+            input=golden.input,
+            expected_output=golden.expected_output,
+            actual_output=f"answer to {golden.input}"
+        )
+
+class FakeEvaluator:
+    """Scores every case, failing the inputs listed in failures"""
+    def __init__(self, failures=None):
+        self.failures = failures or {}
+
+    def evaluate_test_case(self, test_case):
+        if test_case.input in self.failures:
+            raise self.failures[test_case.input]
+        metric = MetricResult("response_accuracy_metric", 0.9, 0.7, True, "ok", "fake")
+        return CaseResult(test_case.input, test_case.expected_output, test_case.actual_output, [metric])
+
+def make_goldens(count):
+    return [GoldenTestCase(f"q{i}", f"a{i}", []) for i in range(1, count + 1)]
+
+def make_pipeline(generator, evaluator):
+    return EvaluationPipeline(generator, evaluator, generation_workers=2, judge_workers=2, queue_depth=2)
+
+def test_every_golden_reported_once_despite_failures():
+    goldens = make_goldens(20)
+    generator = FakeTestGenerator(goldens, failures={
+        "q3": RuntimeError("throttled"),
+        "q7": CallTimeoutError("generate call exceeded 90s deadline")
+    })
+    evaluator = FakeEvaluator(failures={"q5": RuntimeError("judge failed")})
+    results = {}
+
+    def on_result(test_id, result):
+        assert test_id not in results
+        results[test_id] = result
+
+    completed = make_pipeline(generator, evaluator).run(on_result)
+
+    assert completed == len(goldens)
+    assert sorted(results) == list(range(1, len(goldens) + 1))
+    assert results[3].status == "error"
+    assert results[7].status == "timeout"
+    assert results[5].status == "error"
+    assert results[5].actual_output == "answer to q5"
+    assert all(results[i].status == "ok" for i in results if i not in (3, 5, 7))
+
+def test_on_result_error_is_reraised_without_hanging():
+    goldens = make_goldens(50)
+    pipeline = make_pipeline(FakeTestGenerator(goldens), FakeEvaluator())
+
+    def on_result(test_id, result):
+        raise ValueError("results store unavailable")
+
+    threads_before = set(threading.enumerate())
+    start = time.monotonic()
+    with pytest.raises(ValueError, match="results store unavailable"):
+        pipeline.run(on_result)
+
+    assert time.monotonic() - start < 5
+    # Worker threads are released rather than left blocked on full queues
+    assert not [thread for thread in threading.enumerate()
+                if thread not in threads_before and thread.is_alive()]